@@ -1,19 +1,32 @@
 # src/agents/assurance.py
 
-from typing import Dict, Any, Optional
-from dataclasses import dataclass
+from typing import Dict, Any, Mapping, Optional
+from dataclasses import dataclass, field
+from types import MappingProxyType
+import asyncio
 import structlog
 
 from .base import BaseAgent
 from ..models.intent import Intent, IntentType
 from ..config import Config, ValidationRuleConfig
 
-@dataclass
+# Shared by every AssuranceAgent instead of being looked up per instance
+logger = structlog.get_logger()
+
+@dataclass(frozen=True)
 class ValidationRule:
-    """Rule definition for validation"""
+    """Rule definition for validation
+
+    Rules are shared between skills, so params is copied into a read-only
+    mapping. It is left out of the hash, which keeps rules hashable while
+    equal rules still hash alike.
+    """
     type: str
     validator: str
-    params: Dict[str, Any] = None
+    params: Mapping[str, Any] = field(default_factory=dict, hash=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "params", MappingProxyType(dict(self.params)))
 
     @classmethod
     def from_config(cls, config: ValidationRuleConfig) -> 'ValidationRule':
@@ -34,8 +47,19 @@ class AssuranceAgent(BaseAgent):
             config: System configuration
         """
         super().__init__(config)
-        self.logger = structlog.get_logger()
+        self.logger = logger
         self.verification_rules = self._load_rules()
+        
+        # Map validator names to bound _validate_<name> methods once, so rule
+        # dispatch is a dict lookup instead of a getattr per rule
+        self._validators = {
+            name[len("_validate_"):]: getattr(self, name)
+            for name in dir(type(self))
+            if name.startswith("_validate_") and name != "_validate_rule"
+        }
+
+        # Validator names already reported as missing, so each is warned about once
+        self._missing_validators = set()
 
     async def verify(self, asset: 'Asset') -> Intent:
         """Verify an asset according to rules"""
@@ -44,23 +68,18 @@ class AssuranceAgent(BaseAgent):
 
     async def validateSkillExecution(self, skill: str, result: Any) -> bool:
         """Validate skill execution results"""
-        # Get skill-specific rules
-        if skill not in self.verification_rules:
+        # verification_rules maps each name to a single rule, so there is
+        # nothing to run concurrently; await it directly
+        rule = self.verification_rules.get(skill)
+        if rule is None:
             self.logger.debug("assurance.no_rules_for_skill", skill=skill)
             return True
 
         try:
-            for rule in self.verification_rules[skill]:
-                self.logger.debug("assurance.applying_rule", 
-                                skill=skill,
-                                rule=rule)
-                
-                # Execute validation logic
-                valid = await self._validate_rule(rule, result)
-                if not valid:
-                    return False
-                    
-            return True
+            self.logger.debug("assurance.applying_rule", 
+                            skill=skill,
+                            rule=rule)
+            return await self._validate_rule(rule, result)
             
         except Exception as e:
             self.logger.exception("assurance.validation_failed",
@@ -78,14 +97,13 @@ class AssuranceAgent(BaseAgent):
             if not asset:
                 raise ValueError("No asset provided for verification")
                 
-            # Apply verification rules
-            verification_results = {}
-            for rule_name, rules in self.verification_rules.items():
-                results = []
-                for rule in rules:
-                    result = await self._validate_rule(rule, asset)
-                    results.append(result)
-                verification_results[rule_name] = results
+            # Apply verification rules concurrently; each validator handles its own errors
+            rule_names = list(self.verification_rules)
+            results = await asyncio.gather(*(
+                self._validate_rule(self.verification_rules[rule_name], asset)
+                for rule_name in rule_names
+            ))
+            verification_results = dict(zip(rule_names, results))
             
             # Update intent with results    
             intent.context['verification_results'] = verification_results
@@ -101,7 +119,7 @@ class AssuranceAgent(BaseAgent):
         return Intent(
             type=IntentType.VERIFICATION,
             description=f"Verify asset: {asset.id}",
-            context={"asset": asset.dict()},
+            context={"asset": asset.model_dump()},
             criteria={"verify": True}
         )
 
@@ -125,10 +143,12 @@ class AssuranceAgent(BaseAgent):
         """Execute a validation rule"""
         try:
             # Get validator function
-            validator = getattr(self, f"_validate_{rule.validator}", None)
-            if not validator:
-                self.logger.warning("assurance.validator_not_found",
-                                  validator=rule.validator)
+            validator = self._validators.get(rule.validator)
+            if validator is None:
+                if rule.validator not in self._missing_validators:
+                    self._missing_validators.add(rule.validator)
+                    self.logger.warning("assurance.validator_not_found",
+                                      validator=rule.validator)
                 return False
 
             # Execute validation
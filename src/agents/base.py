@@ -1,5 +1,6 @@
 # src/agents/base.py
 
+import os
 from typing import Dict, Any, Optional, List, Union, Callable
 from datetime import datetime
 import structlog
@@ -8,20 +9,39 @@ from autogen import (
     Agent,
     AssistantAgent,
     GroupChat,
-    GroupChatManager,
-    config_list_from_json
+    GroupChatManager
 )
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
-from src.models.intent import Intent, IntentStatus, ResolutionState
+from src.models.intent import Intent
 from src.config import Config
+from src.skills.llm_cache import LLMCache
+
+# Response cache shared by all intent agents running at temperature 0
+_llm_cache = LLMCache()
+
+def _default_llm_config(config: Config) -> Dict[str, Any]:
+    """Build an agent's llm_config from the default provider in config"""
+    provider = config.providers[config.default_llm]
+    return {
+        "config_list": [{
+            # Provider extras such as base_url or api_type
+            **provider.additional_params,
+            "model": provider.model,
+            "api_key": os.getenv(provider.api_key_env),
+            # Passed to the OpenAI client, which retries transient errors with jittered backoff
+            "max_retries": provider.max_retries
+        }],
+        "temperature": provider.temperature,
+        "timeout": provider.timeout
+    }
 
 class AgentMessage(BaseModel):
     """Structured message format for agent communication"""
     intent_id: str
     message_type: str
     content: Dict[str, Any]
-    timestamp: datetime = datetime.utcnow()
+    timestamp: datetime = Field(default_factory=datetime.utcnow)
 
 class IntentAgent(ConversableAgent):
     """Base agent class integrating AutoGen 0.3.1 with Intent Architecture"""
@@ -36,13 +56,7 @@ class IntentAgent(ConversableAgent):
     ):
         # Configure LLM settings from config
         if llm_config is None:
-            llm_config = {
-                "config_list": config_list_from_json(
-                    config.providers[config.default_llm].dict()
-                ),
-                "temperature": config.providers[config.default_llm].temperature,
-                "timeout": config.providers[config.default_llm].timeout
-            }
+            llm_config = _default_llm_config(config)
         
         # Initialize AutoGen agent with 0.3.1 parameters
         super().__init__(
@@ -53,7 +67,13 @@ class IntentAgent(ConversableAgent):
         )
         
         self.config = config
-        self.logger = structlog.get_logger()
+        # Bind the agent name once rather than passing it on every event
+        self.logger = structlog.get_logger().bind(agent=name)
+
+        # Deterministic agents can answer repeated prompts from the shared
+        # cache, unless the caller chose AutoGen's cache_seed caching instead
+        if llm_config and llm_config.get("temperature", 0) == 0 and "cache_seed" not in llm_config:
+            self.client_cache = _llm_cache
         
         # Register reply functions with AutoGen 0.3.1 syntax
         self.register_reply(
@@ -78,7 +98,6 @@ class IntentAgent(ConversableAgent):
             
             self.logger.info(
                 "agent.intent_received",
-                agent=self.name,
                 intent_id=str(intent.id),
                 intent_type=intent.type
             )
@@ -170,6 +189,22 @@ class IntentAgent(ConversableAgent):
 
 class IntentAssistantAgent(IntentAgent, AssistantAgent):
     """Assistant agent specialized for intent analysis and orchestration"""
+
+    # Static role instructions appended to the configured prompt overlay
+    ROLE_PROMPT = """
+        
+        As an Intent Assistant Agent, you:
+        1. Analyze incoming intents to determine processing strategy
+        2. Coordinate with other agents for intent resolution
+        3. Maintain intent lineage and transformation history
+        4. Handle error recovery and debugging
+        
+        Follow the intent architecture flow:
+        - Analyze intent requirements
+        - Determine skill needs
+        - Manage decomposition
+        - Track resolution state
+        """
     
     def __init__(
         self,
@@ -186,21 +221,7 @@ class IntentAssistantAgent(IntentAgent, AssistantAgent):
 
     def _build_system_message(self, config: Config) -> str:
         """Build specialized system message for assistant"""
-        base_message = config.master_prompt_overlay
-        return f"""{base_message}
-        
-        As an Intent Assistant Agent, you:
-        1. Analyze incoming intents to determine processing strategy
-        2. Coordinate with other agents for intent resolution
-        3. Maintain intent lineage and transformation history
-        4. Handle error recovery and debugging
-        
-        Follow the intent architecture flow:
-        - Analyze intent requirements
-        - Determine skill needs
-        - Manage decomposition
-        - Track resolution state
-        """
+        return config.master_prompt_overlay + self.ROLE_PROMPT
 
 class IntentGroupChat:
     """Manages multi-agent conversations for intent processing using AutoGen 0.3.1"""
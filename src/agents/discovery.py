@@ -1,17 +1,34 @@
 # src/agents/discovery.py
 
 import os
+import asyncio
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any
+from types import ModuleType
+from typing import Dict, Any, List, Tuple
 from datetime import datetime
-import subprocess
-import sys
 import structlog
 
 from src.agents.base import BaseAgent
 from src.models.intent import Intent, ResolutionState
 from src.config import Config
 
+EXCLUDED_PATTERNS = ["*.pyc", "*.DS_Store"]
+
+# Directory names pruned from the scan without descending into them
+EXCLUDED_DIRS = ["__pycache__"]
+
+# Upper bound on project scans running at once across all discovery agents
+MAX_CONCURRENT_SCANS = 4
+
+# Scans run on this pool; its size is the bound. Unlike an asyncio primitive
+# it is not tied to an event loop, so it works across asyncio.run calls
+_SCAN_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_SCANS, thread_name_prefix="discovery")
+
+# Skill modules already loaded, keyed by resolved path
+_SKILL_MODULES: Dict[str, ModuleType] = {}
+
 class DiscoveryAgent(BaseAgent):
     """Agent responsible for discovering project structure, dependencies, and determining scope.
     
@@ -35,11 +52,30 @@ class DiscoveryAgent(BaseAgent):
             if not self.skill_path.exists():
                 raise FileNotFoundError(f"Required skill not found: {self.skill_path}")
                 
+            # Load the skill once so discovery runs in-process
+            self.tartxt = self._load_skill(self.skill_path)
+
+            # Scans in progress, keyed by absolute project path, so concurrent
+            # requests for the same project share one scan
+            self._inflight: Dict[str, asyncio.Future] = {}
+            
             self.logger = structlog.get_logger()
             
         except Exception as e:
             raise ValueError(f"Discovery agent initialization failed: {str(e)}")
 
+    @staticmethod
+    def _load_skill(skill_path: Path) -> ModuleType:
+        """Import a skill module from its configured path, once per process"""
+        key = str(skill_path.resolve())
+        module = _SKILL_MODULES.get(key)
+        if module is None:
+            spec = importlib.util.spec_from_file_location(skill_path.stem, skill_path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            _SKILL_MODULES[key] = module
+        return module
+
     async def process_intent(self, intent: Intent) -> Intent:
         """Process a discovery intent
         
@@ -64,10 +100,10 @@ class DiscoveryAgent(BaseAgent):
                 raise ValueError("No project path provided in intent environment")
 
             # Run project discovery
-            discovery_content = await self._discover_project(project_path)
+            manifest, files = await self._discover_project(project_path)
             
-            # Parse and structure results
-            structured_discovery = self._structure_discovery(discovery_content)
+            # Structure results
+            structured_discovery = self._structure_discovery(manifest, files)
             
             # Add results to intent context
             intent.context.update({
@@ -91,91 +127,84 @@ class DiscoveryAgent(BaseAgent):
         except Exception as e:
             return await self.handle_error(e, intent)
 
-    async def _discover_project(self, project_path: str) -> str:
-        """Run project discovery using tartxt skill"""
+    async def _discover_project(self, project_path: str) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """Run project discovery using the tartxt skill in-process"""
+        key = os.path.abspath(project_path)
+        scan = self._inflight.get(key)
+        if scan is None:
+            scan = asyncio.ensure_future(self._scan_project(project_path))
+            self._inflight[key] = scan
+            scan.add_done_callback(lambda _: self._inflight.pop(key, None))
+
         try:
-            result = subprocess.run(
-                [
-                    sys.executable,
-                    str(self.skill_path),  # Convert Path to string
-                    "--exclude", "*.pyc,__pycache__,*.DS_Store",
-                    "--output",
-                    project_path
-                ],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            return result.stdout
-            
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"Failed to discover project: {e.stderr}")
+            # Shield the shared scan so one cancelled caller doesn't cancel it for the others
+            manifest, files = await asyncio.shield(scan)
+        except OSError as e:
+            raise RuntimeError(f"Failed to discover project: {e}")
+        # Coalesced callers share one result; give each its own copy since
+        # the lists end up in separate intents' contexts
+        return list(manifest), [dict(f) for f in files]
 
-    def _structure_discovery(self, raw_content: str) -> Dict[str, Any]:
-        """Convert raw tartxt output into structured discovery results"""
+    async def _scan_project(self, project_path: str) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """Scan a project on the shared, bounded scan pool"""
+        # The scan is blocking filesystem work; keep it off the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _SCAN_EXECUTOR, self.tartxt.scan_files, [project_path], EXCLUDED_PATTERNS, EXCLUDED_DIRS
+        )
+
+    def _structure_discovery(self, manifest: List[str], files: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Convert tartxt scan results into structured discovery results"""
         discovery = {
-            "files": [],
+            "files": files,
             "directories": set(),
             "file_types": {},
-            "manifest": [],
+            "manifest": manifest,
             "patterns": {},
             "dependencies": set()
         }
         
-        # Parse the content
-        sections = raw_content.split("==")
-        for section in sections:
-            if section.strip().startswith("Manifest"):
-                discovery["manifest"] = [
-                    line.strip() for line in section.split("\n") 
-                    if line.strip() and "Manifest" not in line
-                ]
-                
-            elif "File:" in section:
-                file_info = {}
-                for line in section.split("\n"):
-                    if line.startswith("File:"):
-                        file_info["path"] = line.split(":", 1)[1].strip()
-                        discovery["directories"].add(str(Path(file_info["path"]).parent))
-                    elif line.startswith("File Type:"):
-                        file_type = line.split(":", 1)[1].strip()
-                        file_info["type"] = file_type
-                        discovery["file_types"][file_type] = discovery["file_types"].get(file_type, 0) + 1
-                    elif line.startswith("Size:"):
-                        file_info["size"] = int(line.split(":", 1)[1].split()[0])
-                
-                if file_info:
-                    discovery["files"].append(file_info)
+        for file_info in files:
+            discovery["directories"].add(os.path.dirname(file_info["path"]))
+            file_type = file_info["type"]
+            discovery["file_types"][file_type] = discovery["file_types"].get(file_type, 0) + 1
         
-        # Convert sets to sorted lists
-        discovery["directories"] = sorted(list(discovery["directories"]))
+        # Convert sets to sorted lists, normalizing each distinct directory once
+        discovery["directories"] = sorted({os.path.normpath(d) for d in discovery["directories"]})
         discovery["dependencies"] = sorted(list(discovery["dependencies"]))
         
         return discovery
 
     def _calculate_metrics(self, discovery: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate metrics from the discovery results"""
+        total_files = len(discovery["files"])
+        total_size = sum(f["size"] for f in discovery["files"])
         return {
-            "total_files": len(discovery["files"]),
+            "total_files": total_files,
             "total_directories": len(discovery["directories"]),
             "file_type_distribution": discovery["file_types"],
-            "total_size": sum(f["size"] for f in discovery["files"]),
-            "average_file_size": sum(f["size"] for f in discovery["files"]) / len(discovery["files"]) if discovery["files"] else 0,
+            "total_size": total_size,
+            "average_file_size": total_size / total_files if total_files else 0,
             "identified_patterns": len(discovery.get("patterns", {})),
             "detected_dependencies": len(discovery.get("dependencies", set()))
         }
 
     def _determine_scope(self, discovery: Dict[str, Any]) -> Dict[str, Any]:
         """Determine project scope based on discovery results"""
+        # Split directories into test and internal in a single pass
+        internal, test = [], []
+        for directory in discovery["directories"]:
+            (test if "test" in directory.lower() else internal).append(directory)
+
         return {
             "root_path": min(discovery["directories"], key=len) if discovery["directories"] else None,
             "included_paths": discovery["directories"],
-            "excluded_patterns": ["*.pyc", "__pycache__", "*.DS_Store"],
+            "excluded_patterns": EXCLUDED_PATTERNS + EXCLUDED_DIRS,
             "primary_language": max(discovery["file_types"].items(), key=lambda x: x[1])[0] if discovery["file_types"] else None,
             "estimated_complexity": self._estimate_complexity(discovery),
             "boundaries": {
-                "internal": [d for d in discovery["directories"] if "test" not in d.lower()],
-                "test": [d for d in discovery["directories"] if "test" in d.lower()],
+                "internal": internal,
+                "test": test,
                 "third_party": list(discovery.get("dependencies", set()))
             }
         }
@@ -1,13 +1,15 @@
 # src/agents/orchestration.py
 
 import os
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 import autogen
 from pydantic import BaseModel
-import libcst as cst
 import structlog
 
+from src.config import DEFAULT_MAX_RETRIES
+from src.skills.llm_cache import LLMCache
+
 class RefactorConfig(BaseModel):
     """Configuration for code refactoring"""
     project_path: str
@@ -23,32 +25,22 @@ class RefactorAction(BaseModel):
     cst_transformer_class: str
     validation_rules: List[str] = []
 
+def _build_llm_config(model: str, api_key: Optional[str], max_retries: int = DEFAULT_MAX_RETRIES) -> Dict[str, Any]:
+    """Build the LLM config shared by the agents of one system.
+
+    max_retries is handed to the OpenAI client, which retries rate limits and
+    server errors with jittered backoff.
+    """
+    return {
+        "config_list": [{"model": model, "api_key": api_key, "max_retries": max_retries}],
+        "temperature": 0
+    }
+
 class ProjectRefactorSystem:
     """AutoGen-based project refactoring system"""
-    
-    def __init__(self, config_path: str):
-        self.logger = structlog.get_logger()
-        self.config_path = config_path
-        self._setup_agents()
-        
-    def _setup_agents(self):
-        """Initialize AutoGen agent network"""
-        # Configuration for the LLM
-        config_list = [
-            {
-                "model": "gpt-4",
-                "api_key": os.getenv("OPENAI_API_KEY")
-            }
-        ]
 
-        # Create the solution architect agent
-        self.solution_agent = autogen.AssistantAgent(
-            name="solution_architect",
-            llm_config={
-                "config_list": config_list,
-                "temperature": 0
-            },
-            system_message="""You are a solution architect that analyzes code refactoring requirements.
+    # Static system prompts, shared by every instance
+    SOLUTION_ARCHITECT_PROMPT = """You are a solution architect that analyzes code refactoring requirements.
             Your role is to:
             1. Analyze the refactoring intent
             2. Break down the requirements into specific libcst transformations
@@ -60,6 +52,37 @@ class ProjectRefactorSystem:
             - List of RefactorAction objects
             - Each action must specify the exact libcst transformer class needed
             - Include validation rules for the transformation"""
+
+    VERIFIER_PROMPT = """You verify code transformations:
+            1. Check syntax validity
+            2. Verify transformation correctness
+            3. Run specified tests
+            4. Ensure no unintended changes
+            5. Validate against provided rules"""
+
+    SUPERVISOR_PROMPT = """You coordinate the refactoring process:
+            1. Manage the flow between agents
+            2. Handle errors and retries
+            3. Maintain project state
+            4. Ensure all validations pass
+            5. Manage the refactoring lifecycle"""
+    
+    def __init__(self, config_path: str, cache_path: Optional[str] = None):
+        self.logger = structlog.get_logger()
+        self.config_path = config_path
+        self.cache_path = cache_path
+        self._setup_agents()
+        
+    def _setup_agents(self):
+        """Initialize AutoGen agent network"""
+        # Configuration for the LLM
+        llm_config = _build_llm_config("gpt-4", os.getenv("OPENAI_API_KEY"))
+
+        # Create the solution architect agent
+        self.solution_agent = autogen.AssistantAgent(
+            name="solution_architect",
+            llm_config=llm_config,
+            system_message=self.SOLUTION_ARCHITECT_PROMPT
         )
         
         # Create the code refactoring agent
@@ -75,31 +98,15 @@ class ProjectRefactorSystem:
         # Create the verification agent
         self.verifier = autogen.AssistantAgent(
             name="code_verifier",
-            llm_config={
-                "config_list": config_list,
-                "temperature": 0
-            },
-            system_message="""You verify code transformations:
-            1. Check syntax validity
-            2. Verify transformation correctness
-            3. Run specified tests
-            4. Ensure no unintended changes
-            5. Validate against provided rules"""
+            llm_config=llm_config,
+            system_message=self.VERIFIER_PROMPT
         )
         
         # Create the supervisor agent
         self.supervisor = autogen.AssistantAgent(
             name="supervisor",
-            llm_config={
-                "config_list": config_list,
-                "temperature": 0
-            },
-            system_message="""You coordinate the refactoring process:
-            1. Manage the flow between agents
-            2. Handle errors and retries
-            3. Maintain project state
-            4. Ensure all validations pass
-            5. Manage the refactoring lifecycle"""
+            llm_config=llm_config,
+            system_message=self.SUPERVISOR_PROMPT
         )
         
         # Create group chat
@@ -111,12 +118,28 @@ class ProjectRefactorSystem:
         
         self.manager = autogen.GroupChatManager(
             groupchat=self.group_chat,
-            llm_config={
-                "config_list": config_list,
-                "temperature": 0
-            }
+            llm_config=llm_config
         )
 
+        # All LLM-backed agents run at temperature 0, so identical prompts
+        # can be answered from a shared response cache, persisted to
+        # cache_path when one is given. client_cache replaces AutoGen's
+        # cache_seed disk cache, so without cache_path nothing is reused
+        # across runs.
+        self.llm_cache = LLMCache(path=self.cache_path)
+        for agent in (self.solution_agent, self.verifier, self.supervisor, self.manager):
+            agent.client_cache = self.llm_cache
+
+    def close(self) -> None:
+        """Release resources held by the system, flushing the response cache"""
+        self.llm_cache.close()
+
+    async def __aenter__(self) -> 'ProjectRefactorSystem':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
     async def process_refactor_request(self, intent_msg: str, project_path: str) -> Dict[str, Any]:
         """Process a refactoring request through the agent network"""
         try:
@@ -127,16 +150,18 @@ class ProjectRefactorSystem:
             # Create refactor config
             config = RefactorConfig(project_path=project_path)
             
-            # Create initial message for the group chat
+            # Create initial message for the group chat. Static fields come
+            # first so the serialized prompt shares a stable prefix across
+            # requests and provider-side prefix caching can reuse it.
             message = {
                 "type": "refactor_request",
-                "intent": intent_msg,
-                "config": config.dict(),
                 "requirements": {
                     "use_libcst": True,
                     "maintain_functionality": True,
                     "generate_validation": True
-                }
+                },
+                "intent": intent_msg,
+                "config": config.dict()
             }
             
             # Run the refactoring process through group chat
@@ -165,12 +190,12 @@ class ProjectRefactorSystem:
         """Validate refactoring results through the verification agent"""
         verification_message = {
             "type": "verify_refactor",
-            "results": results,
             "validation_rules": {
                 "syntax_valid": True,
                 "tests_pass": True,
                 "no_unintended_changes": True
-            }
+            },
+            "results": results
         }
         
         return await self.verifier.run(verification_message)
\ No newline at end of file
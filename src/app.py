@@ -28,11 +28,14 @@ class IntentApp:
         self.logger.info("app.initialize.starting")
         
         try:
-            await self.orchestrator.initialize()
-            await self.assurance.initialize()
+            # Agents initialize independently, so bring them up concurrently
+            await asyncio.gather(
+                self.orchestrator.initialize(),
+                self.assurance.initialize()
+            )
             
             # Ensure asset directory exists
-            self.config.asset_base_path.mkdir(parents=True, exist_ok=True)
+            await asyncio.to_thread(self.config.asset_base_path.mkdir, parents=True, exist_ok=True)
             
             self.logger.info("app.initialize.complete")
             
@@ -9,6 +9,7 @@ import yaml
 from pydantic import BaseModel, Field
 
 from .agents.orchestrator import ProjectAnalysisSystem
+from .config import SafeLoader
 
 # Config Models
 class LLMConfig(BaseModel):
@@ -37,7 +38,7 @@ class SystemConfig(BaseModel):
 def load_config(config_path: Path) -> SystemConfig:
     """Load system configuration"""
     with open(config_path) as f:
-        raw_config = yaml.safe_load(f)
+        raw_config = yaml.load(f, Loader=SafeLoader)
     
     # Convert skill paths to Path objects
     if 'skills' in raw_config:
@@ -71,7 +72,9 @@ def analyze(
     log_level = "DEBUG" if verbose else "INFO"
     logger = structlog.get_logger()
     structlog.configure(
-        wrapper_class=structlog.make_filtering_bound_logger(log_level)
+        wrapper_class=structlog.make_filtering_bound_logger(log_level),
+        # Resolve the processor chain once per logger instead of on every call
+        cache_logger_on_first_use=True
     )
     
     try:
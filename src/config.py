@@ -10,6 +10,15 @@ from dotenv import load_dotenv
 import os
 import structlog
 
+# Use the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Default number of client-side retries for LLM requests
+DEFAULT_MAX_RETRIES = 5
+
 class LLMProvider(str, Enum):
     """Supported LLM providers"""
     OPENAI = "openai"
@@ -49,6 +58,8 @@ class ProviderConfig(BaseModel):
     api_key_env: str
     timeout: int = 120
     temperature: float = 0
+    # Retries for transient errors (429/5xx), done by the OpenAI client with jittered backoff
+    max_retries: int = DEFAULT_MAX_RETRIES
     additional_params: Dict[str, Any] = Field(default_factory=dict)
 
     @field_validator('api_key_env')
@@ -121,15 +132,6 @@ class Config(BaseModel):
         skill_config = self.get_skill_config(skill_name)
         return skill_config.path
 
-    @field_validator('skills')
-    @classmethod
-    def validate_skills(cls, v: Dict[str, SkillConfig]) -> Dict[str, SkillConfig]:
-        """Validate that all referenced skills exist"""
-        for skill_name, skill_config in v.items():
-            if not skill_config.path.exists():
-                raise ValueError(f"Skill path does not exist: {skill_config.path}")
-        return v
-
     def validate_references(self) -> None:
         """Validate all cross-references in configuration"""
         self._validate_intent_skills()
@@ -166,7 +168,7 @@ class Config(BaseModel):
         try:
             # Load and parse YAML
             with path.open() as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=SafeLoader)
             
             # Convert paths to Path objects
             data['asset_base_path'] = Path(data['asset_base_path'])
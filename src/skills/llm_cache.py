@@ -0,0 +1,175 @@
+# src/skills/llm_cache.py
+
+from typing import Any, Optional, Tuple
+from collections import OrderedDict
+import copy
+import hashlib
+import shelve
+import threading
+import time
+import structlog
+
+class LLMCache:
+    """Exact-match response cache for deterministic LLM calls.
+
+    Implements the get/set/close protocol AutoGen expects from a cache, so an
+    instance can be attached to agents through ``client_cache``. Entries expire
+    after ``ttl`` seconds and the least recently used entry is evicted once
+    ``max_entries`` is reached. When ``path`` is given, responses are also
+    written to a shelve database so they survive across runs.
+
+    AutoGen uses ``client_cache`` in place of its own ``cache_seed`` disk
+    cache (``.cache/<seed>``), so an agent with an LLMCache attached only
+    reuses responses across runs when ``path`` is set.
+
+    AutoGen sets attributes such as ``cost`` and ``config_id`` on the response
+    objects it passes through the cache, so the memory tier stores and hands
+    out shallow copies. Nested message objects are still shared and must be
+    treated as read-only.
+
+    AutoGen runs synchronous LLM calls on executor threads, so one instance
+    may be used from several threads at once; a lock serializes access to
+    both tiers.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        ttl: int = 3600,
+        path: Optional[str] = None,
+        max_disk_entries: int = 10000
+    ):
+        """Initialize the cache
+
+        Args:
+            max_entries: Maximum number of responses held in memory
+            ttl: Seconds before a cached response expires
+            path: Optional shelve file used as a persistent second tier
+            max_disk_entries: Maximum number of responses kept in the shelve file
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_disk_entries = max_disk_entries
+        self.stats = {"hits": 0, "misses": 0}
+        self.logger = structlog.get_logger()
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        # Disk entries carry wall-clock times since they outlive the process
+        self._path = path
+        self._disk: Optional[shelve.Shelf] = shelve.open(path) if path else None
+        self._lock = threading.Lock()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached response for key, or default on a miss"""
+        with self._lock:
+            return self._get(self._digest(key), default)
+
+    @staticmethod
+    def _digest(key: str) -> str:
+        """Hash an AutoGen cache key, which is the whole request serialized as JSON
+
+        Storing and logging the digest keeps full prompt histories out of
+        memory keys, the disk index and the logs.
+        """
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def _get(self, key: str, default: Any) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry[0] > self.ttl:
+            del self._entries[key]
+            entry = None
+
+        if entry is None:
+            entry = self._get_from_disk(key)
+            if entry is None:
+                self.stats["misses"] += 1
+                self.logger.debug("llm_cache.miss", key=key[:12], **self.stats)
+                return default
+            # Promote with the entry's age carried over, so the TTL still
+            # counts from when it was first stored
+            stored_at, value = entry
+            entry = self._remember(key, value, time.monotonic() - (time.time() - stored_at))
+
+        self._entries.move_to_end(key)
+        self.stats["hits"] += 1
+        self.logger.debug("llm_cache.hit", key=key[:12], **self.stats)
+        return copy.copy(entry[1])
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a response, evicting the least recently used entry if full"""
+        key = self._digest(key)
+        with self._lock:
+            self._remember(key, copy.copy(value))
+            if self._disk is not None:
+                self._disk[key] = (time.time(), value)
+                if len(self._disk) > self.max_disk_entries:
+                    self._prune_disk()
+
+    def _remember(self, key: str, value: Any, stored_at: Optional[float] = None) -> Tuple[float, Any]:
+        """Add a response to the in-memory tier, stored at the given monotonic time (default now)"""
+        entry = (time.monotonic() if stored_at is None else stored_at, value)
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def _get_from_disk(self, key: str) -> Optional[Tuple[float, Any]]:
+        """Return an unexpired (wall-clock stored time, response) entry from the disk tier, or None"""
+        if self._disk is None:
+            return None
+        entry = self._disk.get(key)
+        if entry is None:
+            return None
+        if time.time() - entry[0] > self.ttl:
+            del self._disk[key]
+            return None
+        return entry
+
+    def _prune_disk(self) -> None:
+        """Drop expired entries, then the oldest, until the disk tier is 10% under its limit
+
+        Pruning below the limit means the full scan runs once per batch of
+        writes rather than on every write once the file is full. Called
+        from set with the lock held.
+        """
+        now = time.time()
+        stored = sorted((self._disk[key][0], key) for key in list(self._disk.keys()))
+        target = int(self.max_disk_entries * 0.9)
+        excess = len(stored) - target
+        for stored_at, key in stored:
+            if excess <= 0 and now - stored_at <= self.ttl:
+                break
+            del self._disk[key]
+            excess -= 1
+        self._compact_disk()
+        self.logger.debug("llm_cache.disk_pruned", entries=len(self._disk))
+
+    def _compact_disk(self) -> None:
+        """Reclaim the space of deleted entries, which dbm files otherwise keep"""
+        reorganize = getattr(self._disk.dict, "reorganize", None)
+        if reorganize is not None:
+            # gdbm can compact in place
+            reorganize()
+            return
+        # Other backends (e.g. dbm.dumb) only ever append, so rewrite the
+        # live entries into a fresh file
+        live = dict(self._disk.items())
+        self._disk.close()
+        self._disk = shelve.open(self._path, flag="n")
+        self._disk.update(live)
+
+    def close(self) -> None:
+        """Release cache resources"""
+        with self._lock:
+            self._entries.clear()
+            if self._disk is not None:
+                self._disk.close()
+                self._disk = None
+
+    def __enter__(self) -> 'LLMCache':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        # AutoGen enters the cache around every request; the cache must
+        # outlive those blocks, so nothing is released here.
+        pass
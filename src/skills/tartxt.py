@@ -3,56 +3,193 @@
 
 import os
 import sys
-import glob
+import re
+import stat
+import fnmatch
+import functools
 import argparse
-from typing import List, Tuple
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, FrozenSet, Iterable, Iterator, List, NamedTuple, Optional, Pattern, Tuple
 import mimetypes
 
+# Common text-based file extensions
+TEXT_FILE_EXTENSIONS = frozenset({
+    '.dart', '.js', '.java', '.py', '.cpp', '.c', '.h', '.html', '.css',
+    '.txt', '.md', '.sh', '.yml', '.yaml'
+})
+
+# Non text/* MIME types that are still text
+TEXT_MIME_TYPES = frozenset({'application/x-sh', 'application/x-shellscript'})
+
+# Characters that make an exclusion pattern a glob rather than a literal name
+GLOB_CHARS = re.compile(r'[*?[]')
+
+# Number of files read concurrently when producing output
+READ_WORKERS = 8
+
 def get_file_metadata(file_path: str) -> Tuple[str, int, str]:
     """Get file metadata including MIME type, size, and last modified date."""
     mime_type, _ = mimetypes.guess_type(file_path)
-    file_size = os.path.getsize(file_path)
-    last_modified = os.path.getmtime(file_path)
-    return mime_type or "application/octet-stream", file_size, last_modified
+    file_stat = os.stat(file_path)
+    return mime_type or "application/octet-stream", file_stat.st_size, file_stat.st_mtime
 
-def is_text_file(file_path: str) -> bool:
-    """Check if a file is a text file based on its MIME type and extension."""
-    mime_type, _ = mimetypes.guess_type(file_path)
-    
-    # List of common text-based file extensions
-    text_file_extensions = ['.dart', '.js', '.java', '.py', '.cpp', '.c', '.h', '.html', '.css', '.txt', '.md', '.sh', '.yml', '.yaml']
+def get_item_kind(item: str) -> Optional[str]:
+    """Classify an item as "dir" or "file" with a single stat, or None if it is neither."""
+    try:
+        mode = os.stat(item).st_mode
+    except OSError:
+        return None
+    if stat.S_ISDIR(mode):
+        return "dir"
+    if stat.S_ISREG(mode):
+        return "file"
+    return None
 
-    if mime_type and (mime_type.startswith('text/') or mime_type in [
-        'application/x-sh',
-        'application/x-shellscript'
-    ]):
-        return True
-    
-    # Check the file extension as a fallback
+def is_text_file(file_path: str, mime_type: Optional[str] = None) -> bool:
+    """Check if a file is a text file based on its extension and MIME type."""
+    # Known text extensions are the common case and need no MIME lookup
     ext = os.path.splitext(file_path)[1].lower()
-    return ext in text_file_extensions
+    if ext in TEXT_FILE_EXTENSIONS:
+        return True
 
-def process_files(files: List[str], exclusions: List[str]) -> str:
-    """Process files and directories, excluding specified patterns."""
-    output = "== Manifest ==\n"
-    content = "\n== Content ==\n"
+    if mime_type is None:
+        mime_type, _ = mimetypes.guess_type(file_path)
+    return bool(mime_type) and (mime_type.startswith('text/') or mime_type in TEXT_MIME_TYPES)
+
+class Exclusions(NamedTuple):
+    """Compiled exclusion patterns: exact names for literal patterns, one regex for the globs."""
+    literals: FrozenSet[str]
+    pattern: Optional[Pattern[str]]
+
+def compile_exclusions(exclusions: List[str]) -> Optional[Exclusions]:
+    """Compile exclusion glob patterns for matching, or None if there are none."""
+    return _compile_exclusions(tuple(exclusions))
+
+@functools.lru_cache(maxsize=32)
+def _compile_exclusions(exclusions: Tuple[str, ...]) -> Optional[Exclusions]:
+    # Cached so repeated scans with the same patterns (e.g. every discovery run) compile once
+    if not exclusions:
+        return None
+    patterns = [os.path.normcase(pat) for pat in exclusions]
+    # Patterns without wildcards (e.g. __pycache__) only ever match the exact string
+    literals = frozenset(pat for pat in patterns if not GLOB_CHARS.search(pat))
+    globs = [pat for pat in patterns if pat not in literals]
+    pattern = re.compile("|".join(fnmatch.translate(pat) for pat in globs)) if globs else None
+    return Exclusions(literals, pattern)
+
+def is_excluded(file_path: str, excluded: Optional[Exclusions]) -> bool:
+    """Check a path against compiled exclusion patterns, matching fnmatch semantics."""
+    if excluded is None:
+        return False
+    file_path = os.path.normcase(file_path)
+    if file_path in excluded.literals:
+        return True
+    return excluded.pattern is not None and excluded.pattern.match(file_path) is not None
+
+def walk_files(
+    directory: str,
+    excluded: Optional[Exclusions],
+    excluded_dirs: Optional[Exclusions] = None
+) -> Iterator[str]:
+    """Yield files under a directory in os.walk order, using DirEntry types to avoid extra stats.
 
+    File patterns in excluded are matched against file paths only; directories
+    are pruned by name when they match excluded_dirs.
+    """
+    subdirs = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    # Prune excluded directories (e.g. __pycache__) and, like os.walk, don't follow symlinks
+                    if not is_excluded(entry.name, excluded_dirs) and not entry.is_symlink():
+                        subdirs.append(entry.path)
+                elif not is_excluded(entry.path, excluded):
+                    yield entry.path
+    except OSError:
+        return
+
+    for subdir in subdirs:
+        yield from walk_files(subdir, excluded, excluded_dirs)
+
+def iter_item_files(
+    item: str,
+    kind: str,
+    exclusions: List[str],
+    dir_exclusions: Optional[List[str]] = None
+) -> Iterator[str]:
+    """Yield the files for a single file or directory item, excluding specified patterns."""
+    excluded = compile_exclusions(exclusions)
+    if kind == "dir":
+        yield from walk_files(item, excluded, compile_exclusions(dir_exclusions or []))
+    elif not is_excluded(item, excluded):
+        yield item
+
+def scan_files(
+    items: List[str],
+    exclusions: List[str],
+    dir_exclusions: Optional[List[str]] = None
+) -> Tuple[List[str], List[Dict[str, Any]]]:
+    """Collect the manifest and per-file metadata without reading file contents."""
+    manifest = []
+    files = []
+
+    for item in items:
+        kind = get_item_kind(item)
+        if kind is None:
+            manifest.append(f"Warning: {item} does not exist, skipping.")
+            continue
+        for file_path in iter_item_files(item, kind, exclusions, dir_exclusions):
+            mime_type, file_size, _ = get_file_metadata(file_path)
+            manifest.append(file_path)
+            files.append({"path": file_path, "type": mime_type, "size": file_size})
+
+    return manifest, files
+
+def iter_output(
+    files: List[str],
+    exclusions: List[str],
+    dir_exclusions: Optional[List[str]] = None
+) -> Iterator[str]:
+    """Yield the manifest and then each file's content block, one file in memory at a time."""
+    manifest = []
+    file_paths = []
     for item in files:
-        if os.path.isdir(item):
-            for root, _, filenames in os.walk(item):
-                for filename in filenames:
-                    file_path = os.path.join(root, filename)
-                    if not any(glob.fnmatch.fnmatch(file_path, pat) for pat in exclusions):
-                        output += f"{file_path}\n"
-                        content += process_file(file_path)
-        elif os.path.isfile(item):
-            if not any(glob.fnmatch.fnmatch(item, pat) for pat in exclusions):
-                output += f"{item}\n"
-                content += process_file(item)
-        else:
-            output += f"Warning: {item} does not exist, skipping.\n"
-
-    return output + content
+        kind = get_item_kind(item)
+        if kind is None:
+            manifest.append(f"Warning: {item} does not exist, skipping.\n")
+            continue
+        for file_path in iter_item_files(item, kind, exclusions, dir_exclusions):
+            manifest.append(f"{file_path}\n")
+            file_paths.append(file_path)
+
+    yield "== Manifest ==\n"
+    yield "".join(manifest)
+    yield "\n== Content ==\n"
+
+    # Reads are I/O bound, so overlap them in a pool. A bounded window of
+    # futures keeps output in order without holding every file in memory.
+    with ThreadPoolExecutor(max_workers=READ_WORKERS) as executor:
+        pending = deque()
+        for file_path in file_paths:
+            pending.append(executor.submit(process_file, file_path))
+            if len(pending) >= READ_WORKERS * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+def process_files(
+    files: List[str],
+    exclusions: List[str],
+    dir_exclusions: Optional[List[str]] = None
+) -> str:
+    """Process files and directories, excluding specified patterns."""
+    return "".join(iter_output(files, exclusions, dir_exclusions))
 
 def process_file(file_path: str) -> str:
     """Process a single file, returning its content or a skip message for binary files."""
@@ -64,7 +201,7 @@ def process_file(file_path: str) -> str:
     output += f"Size: {file_size} bytes\n"
     output += f"Last Modified: {last_modified}\n"
 
-    if is_text_file(file_path):
+    if is_text_file(file_path, mime_type):
         output += "Contents:\n"
         with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
             output += f.read()
@@ -77,17 +214,64 @@ def process_file(file_path: str) -> str:
 
 def get_incremented_filename(base_filename: str) -> str:
     """Generate an incremented filename if the file already exists."""
+    return next_free_filename(base_filename)[0]
+
+def next_free_filename(base_filename: str, start: int = 0) -> Tuple[str, int]:
+    """Return the first free incremented filename with a counter of at least start, and its counter."""
     name, ext = os.path.splitext(base_filename)
-    counter = 0
+    directory = os.path.dirname(base_filename) or "."
+
+    # Read the directory once instead of stat'ing every candidate name
+    try:
+        with os.scandir(directory) as entries:
+            existing = {entry.name for entry in entries}
+    except FileNotFoundError:
+        existing = set()
+
+    base_name = os.path.basename(name)
+    counter = start
     while True:
-        new_filename = f"{name}_{counter:03d}{ext}" if counter > 0 else f"{name}{ext}"
-        if not os.path.exists(new_filename):
-            return new_filename
+        suffix = f"_{counter:03d}" if counter > 0 else ""
+        candidate = f"{name}{suffix}{ext}"
+        # The scan only rules out exact names; confirm with a stat so that
+        # case-insensitive filesystems (Out.txt vs out.txt) are handled
+        if f"{base_name}{suffix}{ext}" not in existing and not os.path.exists(candidate):
+            return candidate, counter
         counter += 1
 
+def write_output_file(base_filename: str, chunks: Iterable[str]) -> str:
+    """Write output atomically to the next free incremented filename and return that name.
+
+    The content goes to a temp file first, so a partially written file is never
+    visible. It is then hard-linked into place, which fails rather than
+    overwriting if another run claimed the same name in the meantime.
+    """
+    tmp_path = f"{base_filename}.{os.getpid()}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.writelines(chunks)
+        counter = 0
+        while True:
+            output_file, counter = next_free_filename(base_filename, counter)
+            try:
+                os.link(tmp_path, output_file)
+                return output_file
+            except FileExistsError:
+                # Taken since the scan; move past it rather than retrying the same name
+                counter += 1
+            except OSError:
+                # Filesystem without hard links; fall back to a plain rename
+                os.replace(tmp_path, output_file)
+                return output_file
+    finally:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
 def main():
     parser = argparse.ArgumentParser(description="Process and analyze files and directories.")
-    parser.add_argument('-x', '--exclude', help="Glob patterns for files to exclude", default="")
+    parser.add_argument('-x', '--exclude', help="Comma-separated glob patterns matched against file paths to exclude", default="")
+    parser.add_argument('--exclude-dir', help="Comma-separated glob patterns for directory names to skip entirely", default="")
     parser.add_argument('-f', '--file', help="Output file name")
     parser.add_argument('-o', '--output', action='store_true', help="Output to stdout")
     parser.add_argument('items', nargs='+', help="Files and directories to process")
@@ -95,14 +279,14 @@ def main():
     args = parser.parse_args()
 
     exclusions = [pat.strip() for pat in args.exclude.split(',') if pat.strip()]
-    result = process_files(args.items, exclusions)
+    dir_exclusions = [pat.strip() for pat in args.exclude_dir.split(',') if pat.strip()]
+    chunks = iter_output(args.items, exclusions, dir_exclusions)
 
     if args.output:
-        print(result)
+        sys.stdout.writelines(chunks)
+        sys.stdout.write("\n")
     elif args.file:
-        output_file = get_incremented_filename(args.file)
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(result)
+        output_file = write_output_file(args.file, chunks)
         print(f"Output written to {output_file}")
     else:
         print("Error: Either -f or -o must be specified.")
@@ -0,0 +1,28 @@
+# tests/unit/conftest.py
+
+import importlib
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+class _BaseAgent:
+    """Minimal stand-in for the agent base class the agents extend"""
+
+    def __init__(self, config):
+        self.config = config
+
+@pytest.fixture
+def import_agent(monkeypatch):
+    """Import an agent module against stand-ins for names it imports but the tree lacks"""
+    import src.agents.base as base
+    import src.models.intent as intent
+    monkeypatch.setattr(base, "BaseAgent", _BaseAgent, raising=False)
+    monkeypatch.setattr(intent, "IntentType", SimpleNamespace(VERIFICATION="verification"), raising=False)
+    monkeypatch.setattr(intent, "ResolutionState", SimpleNamespace(), raising=False)
+
+    def _import(module_name):
+        monkeypatch.delitem(sys.modules, module_name, raising=False)
+        return importlib.import_module(module_name)
+
+    return _import
@@ -0,0 +1,65 @@
+# tests/unit/test_assurance.py
+
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+import yaml
+
+from src.config import IntentConfig, ValidationConfig, ValidationRuleConfig
+
+SHIPPED_CONFIG = Path(__file__).parents[2] / "config" / "system_config.yml"
+
+@pytest.fixture
+def assurance(import_agent):
+    return import_agent("src.agents.assurance")
+
+@pytest.fixture
+def shipped_config():
+    """The validation and intent sections of config/system_config.yml"""
+    with SHIPPED_CONFIG.open() as f:
+        data = yaml.safe_load(f)
+    return SimpleNamespace(
+        validation=ValidationConfig(**data["validation"]),
+        intents={
+            group: {name: IntentConfig(**intent) for name, intent in intents.items()}
+            for group, intents in data["intents"].items()
+        }
+    )
+
+def test_shipped_rules_load_keyed_by_rule_name(assurance, shipped_config):
+    agent = assurance.AssuranceAgent(shipped_config)
+
+    assert set(agent.verification_rules) == {"must_exist", "structured_output"}
+    assert agent.verification_rules["must_exist"].validator == "path_exists"
+
+def test_tartxt_skill_has_no_rules_and_validates(assurance, shipped_config):
+    agent = assurance.AssuranceAgent(shipped_config)
+
+    assert asyncio.run(agent.validateSkillExecution("tartxt", {})) is True
+
+def test_missing_validator_fails_rule(assurance, shipped_config):
+    agent = assurance.AssuranceAgent(shipped_config)
+
+    # The shipped path_exists validator has no _validate_path_exists method
+    assert asyncio.run(agent.validateSkillExecution("must_exist", {})) is False
+    assert agent._missing_validators == {"path_exists"}
+
+def test_rule_params_are_read_only_copies(assurance):
+    params = {"path": "src"}
+    rule = assurance.ValidationRule.from_config(
+        ValidationRuleConfig(type="file", validator="path_exists", additional_params=params)
+    )
+
+    params["path"] = "other"
+    assert rule.params == {"path": "src"}
+    with pytest.raises(TypeError):
+        rule.params["path"] = "other"
+
+def test_rules_are_hashable(assurance):
+    rule = assurance.ValidationRule(type="file", validator="path_exists", params={"path": "src"})
+    same = assurance.ValidationRule(type="file", validator="path_exists", params={"path": "src"})
+
+    assert rule == same
+    assert len({rule, same}) == 1
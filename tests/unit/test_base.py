@@ -0,0 +1,55 @@
+# tests/unit/test_base.py
+
+from types import SimpleNamespace
+
+import autogen
+
+from src.agents import base
+from src.agents.base import IntentAgent, _default_llm_config
+from src.config import DEFAULT_MAX_RETRIES, ProviderConfig
+
+def _config(**provider_fields):
+    provider = ProviderConfig(model="gpt-4", api_key_env="OPENAI_API_KEY", **provider_fields)
+    return SimpleNamespace(default_llm="openai", providers={"openai": provider})
+
+def test_default_llm_config_uses_provider_settings(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+
+    llm_config = _default_llm_config(_config(
+        max_retries=7, timeout=30, additional_params={"base_url": "http://localhost:8000/v1"}
+    ))
+
+    assert llm_config["config_list"] == [{
+        "base_url": "http://localhost:8000/v1",
+        "model": "gpt-4",
+        "api_key": "sk-test",
+        "max_retries": 7
+    }]
+    assert llm_config["timeout"] == 30
+
+def test_max_retries_reaches_openai_client(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+
+    llm_config = _default_llm_config(_config())
+    wrapper = autogen.OpenAIWrapper(config_list=llm_config["config_list"], cache_seed=None)
+
+    assert wrapper._clients[0]._oai_client.max_retries == DEFAULT_MAX_RETRIES
+
+class _Agent(IntentAgent):
+    # IntentAgent registers this trigger but leaves it to subclasses
+    def _is_intent_message(self, sender):
+        return False
+
+def _agent(**llm_settings):
+    llm_config = {"config_list": [{"model": "gpt-4", "api_key": "sk-test"}], **llm_settings}
+    return _Agent("agent", SimpleNamespace(master_prompt_overlay=""), llm_config=llm_config)
+
+def test_deterministic_agent_uses_shared_cache():
+    assert _agent(temperature=0).client_cache is base._llm_cache
+
+def test_explicit_cache_seed_keeps_autogen_cache():
+    assert _agent(temperature=0, cache_seed=7).client_cache is None
+    assert _agent(temperature=0, cache_seed=None).client_cache is None
+
+def test_sampling_agent_is_not_cached():
+    assert _agent(temperature=0.7).client_cache is None
@@ -0,0 +1,60 @@
+# tests/unit/test_discovery.py
+
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+TARTXT_PATH = Path(__file__).parents[2] / "src" / "skills" / "tartxt.py"
+
+@pytest.fixture
+def discovery(import_agent):
+    return import_agent("src.agents.discovery")
+
+@pytest.fixture
+def agent(discovery):
+    config = SimpleNamespace(skills={"tartxt": SimpleNamespace(path=TARTXT_PATH)})
+    return discovery.DiscoveryAgent(config)
+
+def test_queued_scans_work_across_event_loops(discovery, agent, tmp_path):
+    # More projects than scan workers, so scans have to queue
+    projects = []
+    for i in range(discovery.MAX_CONCURRENT_SCANS * 2):
+        project = tmp_path / f"project_{i}"
+        project.mkdir()
+        (project / "main.py").write_text("print('hi')\n")
+        projects.append(str(project))
+
+    async def scan_all():
+        return await asyncio.gather(*(agent._discover_project(p) for p in projects))
+
+    for _ in range(2):
+        results = asyncio.run(scan_all())
+        assert [files[0]["path"] for _, files in results] == [
+            str(Path(p) / "main.py") for p in projects
+        ]
+
+def test_concurrent_scans_of_one_project_are_coalesced(agent, tmp_path, monkeypatch):
+    (tmp_path / "main.py").write_text("print('hi')\n")
+    calls = []
+    scan_files = agent.tartxt.scan_files
+
+    def counting_scan(items, exclusions, dir_exclusions=None):
+        calls.append(items)
+        return scan_files(items, exclusions, dir_exclusions)
+
+    monkeypatch.setattr(agent.tartxt, "scan_files", counting_scan)
+
+    async def scan_concurrently():
+        return await asyncio.gather(*(agent._discover_project(str(tmp_path)) for _ in range(3)))
+
+    results = asyncio.run(scan_concurrently())
+    assert len(calls) == 1
+    assert results[0] == results[1] == results[2]
+    assert agent._inflight == {}
+
+    # Each caller gets its own lists to put in its intent's context
+    (manifest_a, files_a), (manifest_b, files_b), _ = results
+    assert manifest_a is not manifest_b
+    assert files_a is not files_b and files_a[0] is not files_b[0]
@@ -0,0 +1,159 @@
+# tests/unit/test_llm_cache.py
+
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+from src.skills import llm_cache
+from src.skills.llm_cache import LLMCache
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic and wall clocks for the cache, advanced together"""
+    state = SimpleNamespace(now=1000.0)
+    fake_time = SimpleNamespace(
+        monotonic=lambda: state.now,
+        time=lambda: state.now + 1_700_000_000
+    )
+    monkeypatch.setattr(llm_cache, "time", fake_time)
+    return state
+
+def test_promoted_disk_entry_keeps_its_age(tmp_path, clock):
+    path = str(tmp_path / "cache")
+    cache = LLMCache(ttl=2, path=path)
+    cache.set("key", "response")
+    cache.close()
+
+    clock.now += 1.5
+    cache = LLMCache(ttl=2, path=path)
+    assert cache.get("key") == "response"
+
+    # Stored at t=0 with ttl=2, so it must expire at t=2 even after promotion
+    clock.now += 1
+    assert cache.get("key") is None
+    cache.close()
+
+def test_get_counts_hits_and_misses():
+    cache = LLMCache()
+    cache.set("key", "response")
+
+    assert cache.get("key") == "response"
+    assert cache.get("other", "default") == "default"
+    assert cache.stats == {"hits": 1, "misses": 1}
+
+def test_entry_expires_after_ttl(clock):
+    cache = LLMCache(ttl=10)
+    cache.set("key", "response")
+
+    clock.now += 10
+    assert cache.get("key") == "response"
+    clock.now += 1
+    assert cache.get("key") is None
+    assert LLMCache._digest("key") not in cache._entries
+
+def test_least_recently_used_entry_is_evicted():
+    cache = LLMCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    # Reading a makes b the least recently used
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert list(cache._entries) == [LLMCache._digest("a"), LLMCache._digest("c")]
+    assert cache.get("b") is None
+
+def test_close_releases_memory_and_disk(tmp_path):
+    cache = LLMCache(path=str(tmp_path / "cache"))
+    cache.set("key", "response")
+    cache.close()
+
+    assert not cache._entries
+    assert cache._disk is None
+    assert cache.get("key") is None
+    # Closing twice is harmless
+    cache.close()
+
+def test_exiting_context_keeps_entries():
+    cache = LLMCache()
+    with cache as entered:
+        entered.set("key", "response")
+
+    assert cache.get("key") == "response"
+
+def test_callers_cannot_mutate_cached_response():
+    cache = LLMCache()
+    response = SimpleNamespace(cost=0.1)
+    cache.set("key", response)
+
+    # AutoGen tags each response it returns with the request's config_id
+    response.config_id = 0
+    first = cache.get("key")
+    first.config_id = 1
+
+    assert not hasattr(cache.get("key"), "config_id")
+
+def test_concurrent_use_from_threads(tmp_path, monkeypatch):
+    # Yield to other threads on every clock read, which falls between get's
+    # lookup and its move_to_end. With only four memory slots, another
+    # thread's set then evicts the key in that window unless access is locked.
+    real_time = llm_cache.time
+
+    def yielding_monotonic():
+        real_time.sleep(0.0001)
+        return real_time.monotonic()
+    monkeypatch.setattr(llm_cache, "time", SimpleNamespace(monotonic=yielding_monotonic, time=real_time.time))
+    cache = LLMCache(max_entries=4, path=str(tmp_path / "cache"), max_disk_entries=20)
+
+    def worker(n):
+        for i in range(50):
+            key = f"key-{(n * 7 + i) % 12}"
+            if cache.get(key) is None:
+                cache.set(key, i)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for future in [executor.submit(worker, n) for n in range(8)]:
+            future.result()
+
+    assert len(cache._entries) <= 4
+    cache.close()
+
+def test_prune_drops_expired_then_oldest_entries(tmp_path, clock):
+    cache = LLMCache(ttl=100, path=str(tmp_path / "cache"), max_disk_entries=10)
+    cache.set("expired", 0)
+    clock.now += 101
+    for i in range(10):
+        cache.set(f"key-{i}", i)
+        clock.now += 1
+
+    # The 11th write prunes to 9 entries: the expired one goes first, then the oldest
+    assert set(cache._disk.keys()) == {LLMCache._digest(f"key-{i}") for i in range(1, 10)}
+    cache.close()
+
+def _disk_size(tmp_path):
+    return sum(path.stat().st_size for path in tmp_path.iterdir())
+
+def test_pruned_disk_tier_does_not_keep_growing(tmp_path):
+    cache = LLMCache(max_entries=1, path=str(tmp_path / "cache"), max_disk_entries=100)
+    payload = "x" * 1000
+
+    for i in range(300):
+        cache.set(f"key-{i}", payload)
+    size_after_300 = _disk_size(tmp_path)
+    for i in range(300, 3000):
+        cache.set(f"key-{i}", payload)
+
+    assert len(cache._disk) <= 100
+    assert _disk_size(tmp_path) < size_after_300 * 1.5
+    assert cache.get("key-2999") == payload
+    cache.close()
+
+def test_requests_are_stored_under_their_digest(tmp_path):
+    # AutoGen's key is the full request, message history included
+    request = '{"messages": [{"role": "user", "content": "hi"}], "model": "gpt-4"}'
+    cache = LLMCache(path=str(tmp_path / "cache"))
+    cache.set(request, "response")
+
+    assert list(cache._entries) == list(cache._disk.keys()) == [LLMCache._digest(request)]
+    assert cache.get(request) == "response"
+    cache.close()
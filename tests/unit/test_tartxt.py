@@ -0,0 +1,84 @@
+# tests/unit/test_tartxt.py
+
+import os
+
+from src.skills import tartxt
+
+def test_write_output_file_increments_past_existing(tmp_path):
+    (tmp_path / "out.txt").write_text("old")
+
+    output_file = tartxt.write_output_file(str(tmp_path / "out.txt"), ["new"])
+
+    assert output_file == str(tmp_path / "out_001.txt")
+    assert (tmp_path / "out.txt").read_text() == "old"
+    assert (tmp_path / "out_001.txt").read_text() == "new"
+    assert sorted(os.listdir(tmp_path)) == ["out.txt", "out_001.txt"]
+
+def test_write_output_file_skips_name_claimed_after_scan(tmp_path, monkeypatch):
+    real_link = os.link
+    claimed = str(tmp_path / "out.txt")
+
+    def link(src, dst):
+        # Another run creates out.txt between the scan and the link
+        if dst == claimed and not os.path.exists(claimed):
+            with open(claimed, "w") as f:
+                f.write("other")
+        return real_link(src, dst)
+
+    monkeypatch.setattr(tartxt.os, "link", link)
+    output_file = tartxt.write_output_file(claimed, ["mine"])
+
+    assert output_file == str(tmp_path / "out_001.txt")
+    assert (tmp_path / "out.txt").read_text() == "other"
+    assert (tmp_path / "out_001.txt").read_text() == "mine"
+
+def test_write_output_file_case_insensitive_collision(tmp_path, monkeypatch):
+    (tmp_path / "Out.txt").write_text("old")
+    real_link = os.link
+
+    def case_insensitive_link(src, dst):
+        names = {name.lower() for name in os.listdir(os.path.dirname(dst))}
+        if os.path.basename(dst).lower() in names:
+            raise FileExistsError(dst)
+        return real_link(src, dst)
+
+    monkeypatch.setattr(tartxt.os, "link", case_insensitive_link)
+    output_file = tartxt.write_output_file(str(tmp_path / "out.txt"), ["new"])
+
+    assert output_file == str(tmp_path / "out_001.txt")
+    assert (tmp_path / "Out.txt").read_text() == "old"
+    assert not any(name.endswith(".tmp") for name in os.listdir(tmp_path))
+
+def _tree(tmp_path):
+    for rel in ("src/agents/base.py", "src/agents/__pycache__/base.cpython-311.pyc", "src/main.py"):
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("")
+    return str(tmp_path / "src")
+
+def test_file_exclusions_do_not_prune_directories(tmp_path):
+    root = _tree(tmp_path)
+
+    manifest, _ = tartxt.scan_files([root], ["agents", "*.pyc"])
+
+    assert sorted(manifest) == [
+        os.path.join(root, "agents", "base.py"),
+        os.path.join(root, "main.py")
+    ]
+
+def test_dir_exclusions_prune_by_name(tmp_path):
+    root = _tree(tmp_path)
+
+    manifest, _ = tartxt.scan_files([root], [], ["agents"])
+
+    assert manifest == [os.path.join(root, "main.py")]
+
+def test_cli_exclude_dir(tmp_path, monkeypatch, capsys):
+    root = _tree(tmp_path)
+    monkeypatch.setattr(tartxt.sys, "argv", ["tartxt", "-o", "-x", "*.py", "--exclude-dir", "__pycache__", root])
+
+    tartxt.main()
+
+    manifest = capsys.readouterr().out.split("== Content ==")[0]
+    assert "base.py" not in manifest
+    assert "__pycache__" not in manifest